@@ -7,7 +7,7 @@ Michael Grimsley
 
 Pathfinding Visualizer:
     Color-coded graph search visualizer on a customizable grid
-    Implements Depth-First Search, Breadth-First Search, Greedy Best-First Search, and A*
+    Implements Depth-First Search, Breadth-First Search, Greedy Best-First Search, A*, and Jump Point Search
     User Interface created with the pygame library
 
 Wishlist:
@@ -19,7 +19,9 @@ Wishlist:
 '''
 
 import pygame
+import numpy as np
 import sys
+from search import Node, DFS, BFS, Greedy, AStar, JPS, newSearch, finishSearch, replay, reconstructPath, warmup
 
 # Resolution
 WINDOW_WIDTH = 900
@@ -42,124 +44,6 @@ TILE_SIZE = DEFAULT_TILE_SIZE # for resizing grid
 GRID_WIDTH = WINDOW_HEIGHT // TILE_SIZE
 GRID_HEIGHT = WINDOW_HEIGHT // TILE_SIZE
 
-class Node:
-    '''
-    A class to represent the Nodes used for traversing the GRID matrix
-    
-    Attributes
-    ----------
-    y: int
-        y-coordinate of this Node within GRID
-    x: int
-        x-coordinate of this Node within GRID
-    parent: Node
-        Parent Node of this Node
-    gCost: int
-        The exact path length from this Node to the Start Node
-    hCost: int
-        The estimated path length from this Node to the End Node
-    
-    Methods
-    -------
-    getPos():
-        Returns the x- and y-coordinates of this Node
-    getNeighbors():
-        Returns the Nodes adjacent to this Node
-    fCost():
-        Returns the f-cost of this Node
-    '''
-    
-    def __init__(self, y, x, parent):
-        '''
-        Constructor to initialize the Node attributes
-        
-        g- and h-costs are set to 0
-        
-        Parameters
-        ----------
-        y: int
-            y-coordinate of this Node within GRID
-        x: int
-            x-coordinate of this Node within GRID
-        parent: Node
-            Parent Node of this Node
-        '''
-        self.y = y
-        self.x = x
-        self.parent = parent
-        
-        self.gCost = 0
-        self.hCost = 0
-    
-    def __eq__(self, node):
-        '''
-        Compares the x- and y-coordinates of this Node with the input Node
-        
-        Parameters
-        ----------
-        node: Node
-            Node to compare this Node with
-        
-        Returns
-        -------
-        boolean:
-            True if both nodes have the same x- and y-coordinates
-        '''
-        return isinstance(node, Node) and self.y == node.y and self.x == node.x
-    
-    def getPos(self):
-        '''
-        Returns the x- and y-coordinates of this Node
-        
-        Returns
-        -------
-        tuple:
-            The ordered pair coordinates of this Node
-        '''
-        return self.y, self.x
-    
-    def getNeighbors(self):
-        '''
-        Returns the Nodes adjacent to this Node
-        
-        If diagonal movement is allowed, returns all 8 surrounding neighbors
-        Otherwise, returns the 4 orthogonal neighbors
-        
-        Returns
-        -------
-        tuple:
-            A collection of Nodes adjacent to this Node
-        '''   
-        up = Node(self.y - 1, self.x, self)
-        right = Node(self.y, self.x + 1, self)
-        down = Node(self.y + 1, self.x, self)
-        left = Node(self.y, self.x - 1, self)
-        
-        if DIAGONAL:
-            ur = Node(self.y - 1, self.x + 1, self)
-            dr = Node(self.y + 1, self.x + 1, self)
-            dl = Node(self.y + 1, self.x - 1, self)
-            ul = Node(self.y - 1, self.x - 1, self)
-            
-            return up, right, down, left, ur, dr, dl, ul
-        
-        return up, right, down, left
-    
-    def fCost(self):
-        '''
-        Returns the f-cost of this Node
-        
-        The f-cost of a Node is the sum of its g-cost and h-cost
-            g-cost: the exact path length from a Node to the Start Node
-            h-cost: the estimated path length from a Node to the End Node
-        
-        Returns
-        -------
-        int:
-            f-cost = g-cost + h-cost
-        '''
-        return self.gCost + self.hCost
-
 class Button:
     '''
     A class to represent the Buttons in the User Interface
@@ -184,6 +68,8 @@ class Button:
         Flag for checking if this Button is currently being pressed
     colors: dictionary
         Colors for the 3 states each Button can have
+    surfaces: dictionary
+        Pre-rendered Button surfaces with the text for each of the 3 states
     
     Methods
     -------
@@ -196,6 +82,7 @@ class Button:
         Constructor to initialize the Button attributes
         
         Colors are defined for each state the Button can have
+        The Button is pre-rendered once for each state so drawing it is a single blit
         
         Parameters
         ----------
@@ -229,10 +116,19 @@ class Button:
             'pressed': '#AAAAAA'
         }
         
-        self.surface = pygame.Surface((self.width, self.height))
         self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
         font = pygame.font.SysFont(None, 20)
-        self.contents = font.render(text, True, WHITE)
+        contents = font.render(text, True, WHITE)
+        
+        self.surfaces = {}
+        for state, color in self.colors.items():
+            surface = pygame.Surface((self.width, self.height))
+            surface.fill(color)
+            surface.blit(contents, [
+                self.rect.width / 2 - contents.get_rect().width / 2,
+                self.rect.height / 2 - contents.get_rect().height / 2,
+            ])
+            self.surfaces[state] = surface
         
     def draw(self):
         '''
@@ -242,11 +138,11 @@ class Button:
         The on click function will only be called once for each time the Button is clicked
         '''
         mousePos = pygame.mouse.get_pos()
-        self.surface.fill(self.colors['default'])
+        state = 'default'
         if self.rect.collidepoint(mousePos):
-            self.surface.fill(self.colors['hover'])
+            state = 'hover'
             if pygame.mouse.get_pressed(num_buttons = 3)[0]:
-                self.surface.fill(self.colors['pressed'])
+                state = 'pressed'
                 if not self.isPressed:
                     if self.isArgument:
                         self.onClick(self)
@@ -256,66 +152,67 @@ class Button:
             else:
                 self.isPressed = False
         
-        self.surface.blit(self.contents, [
-            self.rect.width / 2 - self.contents.get_rect().width / 2,
-            self.rect.height / 2 - self.contents.get_rect().height / 2,
-        ])
-        SCREEN.blit(self.surface, self.rect)
-    
+        SCREEN.blit(self.surfaces[state], self.rect)
+
 def main():
     # global variables
-    global SCREEN, GRID, START, END, ALGORITHM, DIAGONAL
-    global open, closed, searching
+    global SCREEN, GRID, DRAWN_GRID, TILE_RECTS, START, END, ALGORITHM, DIAGONAL, FAST_MODE
+    global SEARCH, searching
     
     START = None
     END = None
-    open = []
-    closed = []
     
     # pygame setup
     pygame.init()
+    warmup()
     SCREEN = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
     pygame.display.set_caption('Pathfinding Visualizer')
     CLOCK = pygame.time.Clock()
-    SCREEN.fill(WHITE)
+    SCREEN.fill(WHITE) # also serves as the grid lines
     
     # default grid setup
-    GRID = [[0 for x in range(GRID_WIDTH)] for y in range(GRID_HEIGHT)]
-    for x in range(GRID_WIDTH):
-        GRID[0][x] = 1
-        GRID[GRID_HEIGHT - 1][x] = 1
-    for y in range(GRID_HEIGHT):
-        GRID[y][0] = 1
-        GRID[y][GRID_WIDTH - 1] = 1
+    GRID = np.zeros((GRID_HEIGHT, GRID_WIDTH), dtype = np.uint8)
+    GRID[0, :] = 1
+    GRID[-1, :] = 1
+    GRID[:, 0] = 1
+    GRID[:, -1] = 1
+    DRAWN_GRID = np.full((GRID_HEIGHT, GRID_WIDTH), -1, dtype = np.int32) # GRID values on the screen, -1 until drawn
+    TILE_RECTS = [[pygame.Rect(x * TILE_SIZE + 1, y * TILE_SIZE + 1, TILE_SIZE - 2, TILE_SIZE - 2) for x in range(GRID_WIDTH)] for y in range(GRID_HEIGHT)]
     START = setStart(1, 1)
     END = setEnd(GRID_WIDTH - 2, GRID_HEIGHT - 2)
     
     # search variables
     ALGORITHM = AStar # default algorithm
     DIAGONAL = True
+    FAST_MODE = False # search to completion at once and animate the results afterwards
     searching = False
+    SEARCH = initSearch()
     
     # mouse event variables
     drag = False
     clickType = None
     
     buttons = [
-        Button(625, 200, 100, 50, 'DFS', selectAlgorithm, True),
-        Button(775, 200, 100, 50, 'BFS', selectAlgorithm, True),
-        Button(625, 275, 100, 50, 'Greedy BFS', selectAlgorithm, True),
-        Button(775, 275, 100, 50, 'A*', selectAlgorithm, True),
-        Button(625, 350, 250, 50, 'Toggle Diagonal Movement (D Key)', toggleDiagonal, False),
-        Button(625, 450, 100, 50, 'Reset (R Key)', reset, False),
-        Button(775, 450, 100, 50, 'Clear (C Key)', clear, False),
-        Button(625, 525, 250, 50, 'Begin Search (SPACE Key)', start, False)
+        Button(625, 190, 100, 45, 'DFS', selectAlgorithm, True),
+        Button(775, 190, 100, 45, 'BFS', selectAlgorithm, True),
+        Button(625, 245, 100, 45, 'Greedy BFS', selectAlgorithm, True),
+        Button(775, 245, 100, 45, 'A*', selectAlgorithm, True),
+        Button(625, 300, 250, 45, 'Jump Point Search', selectAlgorithm, True),
+        Button(625, 355, 250, 45, 'Toggle Diagonal Movement (D Key)', toggleDiagonal, False),
+        Button(625, 410, 250, 45, 'Toggle Fast Mode (F Key)', toggleFastMode, False),
+        Button(625, 465, 100, 45, 'Reset (R Key)', reset, False),
+        Button(775, 465, 100, 45, 'Clear (C Key)', clear, False),
+        Button(625, 520, 250, 45, 'Begin Search (SPACE Key)', start, False)
     ]
     
     TICK = 100
     
+    # the legend never changes and nothing draws over it, so it is only drawn once
+    drawLegend()
+    
     # game loop
     while True:
         drawGrid()
-        drawLegend()
         for button in buttons:
             button.draw()
         
@@ -336,11 +233,14 @@ def main():
                 mouseHandler(event, clickType)
         
         if searching:
-            found = ALGORITHM()
+            for _ in range(STEPS_PER_TICK):
+                found = replay(SEARCH) if FAST_MODE else ALGORITHM(SEARCH)
+                if found is not None:
+                    break
             if found == False:
                 searching = False
             elif found == True:
-                reconstructPath()
+                reconstructPath(SEARCH)
                 searching = False
         
         pygame.display.update()
@@ -354,15 +254,19 @@ def drawGrid():
     '''
     Draws a grid with dimensions GRID_WIDTH x GRID_HEIGHT and colors each tile according to the corresponding values in the GRID matrix
     Grid lines are colored white and the size of the grid tiles are determined by TILE_SIZE
+    Only the tiles whose values differ from DRAWN_GRID are redrawn since the rest of the grid is still on the screen
+    Only the inside of each tile (TILE_RECTS) is colored, so the white background of the SCREEN is left showing as the grid lines
     '''
-    for x in range(GRID_WIDTH):
-        for y in range(GRID_HEIGHT):
-            rect = pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-            pygame.draw.rect(SCREEN, COLORS[GRID[y][x]], rect)
-            pygame.draw.rect(SCREEN, WHITE, rect, 1)
+    for y, x in zip(*np.nonzero(GRID != DRAWN_GRID)):
+        pygame.draw.rect(SCREEN, COLORS[GRID[y, x]], TILE_RECTS[y][x])
+    DRAWN_GRID[:] = GRID
 
 def drawLegend():
-    ''' Draws a legend that explains what the color of each tile in the grid represents '''
+    '''
+    Draws a legend that explains what the color of each tile in the grid represents
+    
+    The legend is static, so this is called once before the game loop instead of every frame
+    '''
     font = pygame.font.SysFont(None, 30)
     legend = ["= Path (Right Click)", "= Wall (Left Click)", "= Start (S Key)", "= End (E Key)", "= Available Paths", "= Visited", "= Final Path"]
     
@@ -386,6 +290,7 @@ def keyHandler(event):
     Program Keybinds:
         R = Stop searching and/or clear search results
         D = Switch between allowing adjacent movement and orthogonal movement
+        F = Switch between animating each search step and searching to completion before animating the results
         C = Stop searching and/or clear the walls and search results
         
         (The following keys can only be pressed while the program is not searching)
@@ -405,6 +310,8 @@ def keyHandler(event):
         reset()
     elif event.key == pygame.K_d:
         toggleDiagonal()
+    elif event.key == pygame.K_f:
+        toggleFastMode()
     elif event.key == pygame.K_c:
         clear()
     else:
@@ -430,6 +337,8 @@ def mouseHandler(event, clickType):
     Right Clicking converts the hovered tile into a path
     Clicking and dragging also converts tiles accordingly
     
+    Tiles cannot be edited while a fast mode search is being animated, since its results were found before the edit
+    
     Parameters
     ----------
     event: Event
@@ -437,13 +346,16 @@ def mouseHandler(event, clickType):
     clickType: int
         Number representing which mouse button has been clicked
     '''
+    if searching and FAST_MODE:
+        return
+    
     xPos, yPos = event.pos
     y, x = getCoordsFromPosition(xPos, yPos)
-    if inGrid(x, y) and GRID[y][x] in [0, 1]:
+    if inGrid(x, y) and GRID[y, x] <= 1: # path or wall
         if clickType == 1: # left click
-            GRID[y][x] = 1
+            GRID[y, x] = 1
         elif clickType == 3: # right click
-            GRID[y][x] = 0
+            GRID[y, x] = 0
 
 def setStart(x, y):
     '''  
@@ -464,8 +376,8 @@ def setStart(x, y):
         Start Node object initialized with new x- and y-coordinates
     '''    
     if START:
-        GRID[START.y][START.x] = 0
-    GRID[y][x] = 2
+        GRID[START.y, START.x] = 0
+    GRID[y, x] = 2
     return Node(y, x, None)
 
 def setEnd(x, y):
@@ -487,8 +399,8 @@ def setEnd(x, y):
         End Node object initialized with new x- and y-coordinates
     '''   
     if END:
-        GRID[END.y][END.x] = 0
-    GRID[y][x] = 3
+        GRID[END.y, END.x] = 0
+    GRID[y, x] = 3
     return Node(y, x, None)
 
 def toggleDiagonal():
@@ -498,6 +410,13 @@ def toggleDiagonal():
     if not searching:
         DIAGONAL = not DIAGONAL
 
+def toggleFastMode():
+    ''' Switch between animating each search step and searching to completion before animating the results '''
+    global FAST_MODE
+    
+    if not searching:
+        FAST_MODE = not FAST_MODE
+
 def selectAlgorithm(button):
     '''
     Selects the Algorithm to traverse the GRID matrix with and begins searching
@@ -518,6 +437,8 @@ def selectAlgorithm(button):
             ALGORITHM = Greedy
         elif button.text == 'A*':
             ALGORITHM = AStar
+        elif button.text == 'Jump Point Search':
+            ALGORITHM = JPS
         start()
 
 def inGrid(x, y):
@@ -538,22 +459,6 @@ def inGrid(x, y):
     '''
     return (x > 0 and x < GRID_WIDTH - 1) and (y > 0 and y < GRID_HEIGHT - 1)
 
-def isPath(node):
-    '''
-    Checks if the tile in the GRID matrix defined by the input Node is a path
-    
-    Parameters
-    ----------
-    node: Node
-        Node object to be evaluated
-    
-    Returns
-    -------
-    boolean
-        True if the tile defined by the input Node has a value that is not equal to 1
-    '''
-    return GRID[node.y][node.x] != 1
-
 def getCoordsFromPosition(xPos, yPos):
     '''
     Returns the coordinates of the tile within the GRID matrix that is at (xPos, yPos) in the window
@@ -572,212 +477,62 @@ def getCoordsFromPosition(xPos, yPos):
     '''
     return yPos // TILE_SIZE, xPos // TILE_SIZE
     
-def HCost(node):
+def initSearch():
     '''
-    Returns the h-cost of the input Node
-    
-    The h-cost of a Node is the estimated path length from that Node to the End Node
-    If diagonal movement is allowed, the h-cost is the Diagonal Distance between the two Nodes
-        max(dy, dx)
-    Otherwise, the h-cost is the Manhattan Distance between the two Nodes
-        dy + dx
-    
-    Parameters
-    ----------
-    node: Node
-        Node to be evaluated
+    Returns a new search state for the GRID matrix, Start Node, End Node, and movement type
     
     Returns
     -------
-    int
-        h-cost
+    SearchState
+        Search state with just the Start Node in the open list
     '''
-    dy = abs(END.y - node.y)
-    dx = abs(END.x - node.x)
-    if DIAGONAL:
-        return max(dy, dx)
-    else:
-        return dy + dx
-
-def reconstructPath():
-    ''' Creates the path from the Start Node to the End Node found by the current algorithm '''
-    curr = closed.pop()
-    parent = curr.parent
-    
-    while parent != None:
-        GRID[curr.y][curr.x] = 6
-        for node in closed:
-            if parent == node:
-                curr, parent = node, node.parent
-                break
-    
-    GRID[START.y][START.x] = 2
-    GRID[END.y][END.x] = 3
+    return newSearch(GRID, START, END, DIAGONAL)
 
 def clear():
     ''' Clears any custom walls and previous search results then stops searching '''
     global searching
     
-    for x in range(1, GRID_WIDTH - 1):
-        for y in range(1, GRID_HEIGHT - 1):
-            GRID[y][x] = 0
+    GRID[1:-1, 1:-1] = 0
     
-    GRID[START.y][START.x] = 2
-    GRID[END.y][END.x] = 3
+    GRID[START.y, START.x] = 2
+    GRID[END.y, END.x] = 3
     
     searching = False
 
 def reset():
     ''' Clears any previous search results then stops searching '''
-    global searching
+    global SEARCH, searching
     
-    open.clear()
-    open.append(START)
-    closed.clear()
+    SEARCH = initSearch()
     
-    for x in range(1, GRID_WIDTH - 1):
-        for y in range(1, GRID_HEIGHT - 1):
-            if GRID[y][x] in [4, 5, 6]:
-                GRID[y][x] = 0
+    GRID[(GRID >= 4) & (GRID <= 6)] = 0
     
-    GRID[START.y][START.x] = 2
-    GRID[END.y][END.x] = 3
+    GRID[START.y, START.x] = 2
+    GRID[END.y, END.x] = 3
     
     searching = False
     
 def start():
-    ''' Clears any previous search results then begins searching '''
-    global searching
-    
-    open.clear()
-    open.append(START)
-    closed.clear()
-    
-    for x in range(1, GRID_WIDTH - 1):
-        for y in range(1, GRID_HEIGHT - 1):
-            if GRID[y][x] in [4, 5, 6]:
-                GRID[y][x] = 0
-    
-    GRID[START.y][START.x] = 2
-    GRID[END.y][END.x] = 3
-    
-    searching = True
-
-##############################
-#         Algorithms         #
-##############################
-
-# Algorithm Explanation:
-# 
-# The open list will initially contain just the Start Node
-# 
-# If the open list is empty, return False
-# - path from Start Node to End Node does not exist
-# 
-# Get next Node from open list
-# - DFS: LIFO
-# - BFS: FIFO
-# - Greedy BFS: lowest h-cost
-# - A*: lowest f-cost
-# 
-# If that Node is the End Node, return True
-# - a path has been found and can be reconstructed
-# 
-# Otherwise, add that Node's available and unvisited neighbors to the open list
-# - Greedy BFS: calculate each neighbor's h-cost
-# - A*: calculate each neighbor's g-cost and h-cost
-#       If the neighbor is already in the open list, compare g-costs to check if this path to that neighbor is better
-#       If the new neighbor has a lower g-cost, replace the old neighbor with the new one
-# 
-# Repeat
-
-def DFS():
-    ''' Searches as far as possible along each path before backtracking '''
-    if not open:
-        return False
-    
-    curr = open.pop()
-    closed.append(curr)
-    GRID[curr.y][curr.x] = 5
-    
-    if curr == END:
-        return True
-    
-    neighbors = curr.getNeighbors()
-    
-    for neighbor in neighbors:
-        if isPath(neighbor) and neighbor not in closed and neighbor not in open:
-            open.append(neighbor)
-            GRID[neighbor.y][neighbor.x] = 4
-
-def BFS():
-    ''' Searches by shortest distance from the Start Node '''
-    if not open:
-        return False
-    
-    curr = open.pop(0)
-    closed.append(curr)
-    GRID[curr.y][curr.x] = 5
-    
-    if curr == END:
-        return True
-    
-    neighbors = curr.getNeighbors()
+    '''
+    Clears any previous search results then begins searching
     
-    for neighbor in neighbors:
-        if isPath(neighbor) and neighbor not in closed and neighbor not in open:
-            open.append(neighbor)
-            GRID[neighbor.y][neighbor.x] = 4
-
-def Greedy():
-    ''' Searches by lowest h-cost '''
-    if not open:
-        return False
+    The number of search steps per tick (STEPS_PER_TICK) grows with the grid area so larger grids are searched proportionally faster
+    In fast mode, the whole search is run on a copy of the GRID matrix and the main loop replays its results
+    '''
+    global SEARCH, searching, STEPS_PER_TICK
     
-    open.sort(key = lambda node: node.hCost)
+    SEARCH = initSearch()
     
-    curr = open.pop(0)
-    closed.append(curr)
-    GRID[curr.y][curr.x] = 5
+    GRID[(GRID >= 4) & (GRID <= 6)] = 0
     
-    if curr == END:
-        return True
+    GRID[START.y, START.x] = 2
+    GRID[END.y, END.x] = 3
     
-    neighbors = curr.getNeighbors()
+    STEPS_PER_TICK = max(1, GRID_WIDTH * GRID_HEIGHT // 200)
+    if FAST_MODE:
+        finishSearch(SEARCH, ALGORITHM)
     
-    for neighbor in neighbors:
-        if isPath(neighbor) and neighbor not in closed and neighbor not in open:
-            neighbor.hCost = HCost(neighbor)
-            open.append(neighbor)
-            GRID[neighbor.y][neighbor.x] = 4
-
-def AStar():
-    ''' Searches by lowest f-cost '''
-    if not open:
-        return False
-    
-    open.sort(key = lambda node: node.fCost())
-    
-    curr = open.pop(0)
-    closed.append(curr)
-    GRID[curr.y][curr.x] = 5
-    
-    if curr == END:
-        return True
-    
-    neighbors = curr.getNeighbors()
-    
-    for neighbor in neighbors:
-        if isPath(neighbor) and neighbor not in closed:
-            neighbor.gCost = curr.gCost + 1
-            neighbor.hCost = HCost(neighbor)
-            if neighbor in open:
-                for i in range(len(open)):
-                    if open[i] == neighbor and neighbor.gCost < open[i].gCost:
-                        open[i] = neighbor
-            else:
-                open.append(neighbor)
-                GRID[neighbor.y][neighbor.x] = 4
+    searching = True
 
 if __name__ == "__main__":
     main()
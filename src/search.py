@@ -0,0 +1,819 @@
+'''
+
+search.py
+
+Graph Search:
+    Search algorithms used by the Pathfinding Visualizer
+    Does not depend on pygame, so searches can be run and timed without the user interface
+    The search loops are compiled with numba when it is installed
+
+'''
+
+import numpy as np
+from dataclasses import dataclass
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        ''' Fallback for when numba is not installed: the search kernels run as regular Python functions '''
+        def decorator(func):
+            return func
+        return decorator
+
+# Neighbor Offsets (dy, dx)
+# the first 4 rows are the orthogonal neighbors and the last 4 rows are the diagonal neighbors
+OFFSETS = np.array((
+    (-1, 0), (0, 1), (1, 0), (0, -1),   # up, right, down, left
+    (-1, 1), (1, 1), (1, -1), (-1, -1)  # up-right, down-right, down-left, up-left
+), dtype = np.int32)
+
+# Tile States during a search
+UNVISITED = 0
+OPEN = 1
+CLOSED = 2
+
+# Search Step Results
+SEARCHING = 0
+FOUND = 1
+NO_PATH = 2
+STEP_RESULTS = (None, True, False) # return values of the algorithm functions for each step result
+
+class Node:
+    '''
+    A class to represent the Nodes used for traversing the grid
+    
+    Attributes
+    ----------
+    y: int
+        y-coordinate of this Node within the grid
+    x: int
+        x-coordinate of this Node within the grid
+    parent: Node
+        Parent Node of this Node
+    pos: tuple
+        The (y, x) coordinates of this Node, used for comparing and hashing
+    
+    Methods
+    -------
+    getPos():
+        Returns the x- and y-coordinates of this Node
+    '''
+    
+    def __init__(self, y, x, parent):
+        '''
+        Constructor to initialize the Node attributes
+        
+        Parameters
+        ----------
+        y: int
+            y-coordinate of this Node within the grid
+        x: int
+            x-coordinate of this Node within the grid
+        parent: Node
+            Parent Node of this Node
+        '''
+        self.y = y
+        self.x = x
+        self.parent = parent
+        self.pos = (y, x)
+    
+    def __eq__(self, node):
+        '''
+        Compares the x- and y-coordinates of this Node with the input Node
+        
+        The input must be a Node
+        
+        Parameters
+        ----------
+        node: Node
+            Node to compare this Node with
+        
+        Returns
+        -------
+        boolean:
+            True if both nodes have the same x- and y-coordinates
+        '''
+        return self.pos == node.pos
+    
+    def __hash__(self):
+        '''
+        Hashes the x- and y-coordinates of this Node so Nodes can be stored in sets and dictionaries
+        
+        Returns
+        -------
+        int:
+            Hash of the ordered pair coordinates of this Node
+        '''
+        return hash(self.pos)
+    
+    def getPos(self):
+        '''
+        Returns the x- and y-coordinates of this Node
+        
+        Returns
+        -------
+        tuple:
+            The ordered pair coordinates of this Node
+        '''
+        return self.pos
+
+@dataclass
+class SearchState:
+    '''
+    A class to hold everything the algorithms read and write during a search
+    
+    The algorithms take the SearchState as an argument instead of reading globals
+    
+    The open list is an array of (priority, h-cost, push order, y, x) rows
+        DFS uses the rows [0, openLen) as a stack
+        BFS uses the rows [openHead, openLen) as a queue
+        Greedy BFS, A*, and JPS use the rows [0, openLen) as a binary heap, with ties broken by h-cost and then push order
+        Greedy BFS pushes an h-cost of 0 since its priority is already the h-cost
+    The closed list is an array of (y, x) rows in the order the tiles were expanded
+    The tiles opened by the expanded tile at closed list index i are the rows [openCounts[i], openCounts[i + 1]) of openOrder
+    
+    Attributes
+    ----------
+    grid: ndarray
+        The grid being searched, with the same tile values as GRID in pathfinder.py
+    start: Node
+        Start Node
+    end: Node
+        End Node
+    diagonal: boolean
+        True if diagonal movement is allowed
+    openList: ndarray
+        Tiles that can be expanded next
+    openHead: int
+        Index of the first row of the open list that is still in use
+    openLen: int
+        Index after the last row of the open list that is in use
+    pushCount: ndarray
+        Number of rows pushed onto the open list heap, as a single element so the kernels can update it
+    closedList: ndarray
+        Tiles that have been expanded
+    closedLen: int
+        Number of tiles that have been expanded
+    openOrder: ndarray
+        Tiles that have been opened, as (y, x) rows in the order they were opened
+    openCounts: ndarray
+        Number of tiles opened by the first i expanded tiles at index i, used to replay fast mode searches
+    gCosts: ndarray
+        g-cost of each tile
+    hCosts: ndarray
+        h-cost of each tile, -1 until calculated
+    parentY: ndarray
+        y-coordinate of the parent of each tile
+    parentX: ndarray
+        x-coordinate of the parent of each tile
+    tileStates: ndarray
+        UNVISITED, OPEN, or CLOSED for each tile
+    result: int
+        Step result of the search, only known before it is finished in fast mode
+    replayLen: int
+        Number of expanded tiles that have been colored by fast mode
+    '''
+    grid: np.ndarray
+    start: Node
+    end: Node
+    diagonal: bool
+    openList: np.ndarray
+    openHead: int
+    openLen: int
+    pushCount: np.ndarray
+    closedList: np.ndarray
+    closedLen: int
+    openOrder: np.ndarray
+    openCounts: np.ndarray
+    gCosts: np.ndarray
+    hCosts: np.ndarray
+    parentY: np.ndarray
+    parentX: np.ndarray
+    tileStates: np.ndarray
+    result: int = SEARCHING
+    replayLen: int = 0
+
+def newSearch(grid, start, end, diagonal):
+    '''
+    Returns a new search state with just the Start Node in the open list
+    
+    A* and JPS can open a tile again from each of its neighbors, so the open list has room for 8 rows per tile
+    Each tile is only added to openOrder the first time it is opened
+    The per-tile arrays have the same shape as the grid
+    The kernels do not check bounds when reading the neighbors of a tile, so the grid must be surrounded by walls
+    
+    Parameters
+    ----------
+    grid: ndarray
+        Grid to be searched, with walls (1) along its first and last rows and columns
+    start: Node
+        Start Node
+    end: Node
+        End Node
+    diagonal: boolean
+        True if diagonal movement is allowed
+    
+    Returns
+    -------
+    SearchState
+        New search state
+    
+    Raises
+    ------
+    ValueError
+        If the grid is not surrounded by walls
+    '''
+    if not ((grid[0] == 1).all() and (grid[-1] == 1).all() and (grid[:, 0] == 1).all() and (grid[:, -1] == 1).all()):
+        raise ValueError('grid must be surrounded by walls')
+    
+    height, width = grid.shape
+    openList = np.empty((height * width * 8, 5), dtype = np.int32)
+    openList[0] = 0, 0, 0, start.y, start.x
+    closedList = np.empty((height * width, 2), dtype = np.int32)
+    
+    shape = (height, width)
+    tileStates = np.full(shape, UNVISITED, dtype = np.int32)
+    tileStates[start.y, start.x] = OPEN
+    
+    return SearchState(
+        grid = grid,
+        start = start,
+        end = end,
+        diagonal = diagonal,
+        openList = openList,
+        openHead = 0,
+        openLen = 1,
+        pushCount = np.ones(1, dtype = np.int32),
+        closedList = closedList,
+        closedLen = 0,
+        openOrder = np.empty((height * width, 2), dtype = np.int32),
+        openCounts = np.zeros(height * width + 1, dtype = np.int32),
+        gCosts = np.zeros(shape, dtype = np.int32),
+        hCosts = np.full(shape, -1, dtype = np.int32),
+        parentY = np.full(shape, -1, dtype = np.int32),
+        parentX = np.full(shape, -1, dtype = np.int32),
+        tileStates = tileStates
+    )
+
+def finishSearch(search, algorithm):
+    '''
+    Runs the input algorithm on a copy of the grid until the search is finished
+    
+    The grid itself is left unchanged so replay can color the expanded tiles afterwards
+    
+    Parameters
+    ----------
+    search: SearchState
+        New search state
+    algorithm: function
+        Algorithm from ALGORITHMS
+    '''
+    s = search
+    s.result, s.closedLen = searchAll(ALGORITHMS.index(algorithm), s.grid.copy(), s.openList, s.pushCount, s.closedList, s.openOrder, s.openCounts, s.gCosts, s.hCosts, s.tileStates, s.parentY, s.parentX, s.end.y, s.end.x, s.diagonal)
+
+def warmup():
+    '''
+    Runs every algorithm on a 3 x 3 grid so numba compiles the kernels, or loads them from its cache, before the first real search
+    '''
+    grid = np.ones((5, 5), dtype = np.uint8)
+    grid[1:-1, 1:-1] = 0
+    start = Node(1, 1, None)
+    end = Node(3, 3, None)
+    
+    for diagonal in (True, False):
+        for algorithm in ALGORITHMS:
+            search = newSearch(grid.copy(), start, end, diagonal)
+            while algorithm(search) is None:
+                pass
+            finishSearch(newSearch(grid.copy(), start, end, diagonal), algorithm)
+
+def reconstructPath(search):
+    '''
+    Creates the path from the Start Node to the End Node found by the current algorithm by following the parent coordinates
+    
+    Jump Point Search parents can be several tiles away in a straight or diagonal line, so the path steps towards each parent one tile at a time
+    
+    Parameters
+    ----------
+    search: SearchState
+        State of the finished search
+    '''
+    grid, start, end = search.grid, search.start, search.end
+    y, x = end.getPos()
+    while (y, x) != start.getPos():
+        py, px = search.parentY[y, x], search.parentX[y, x]
+        while (y, x) != (py, px):
+            grid[y, x] = 6
+            y += np.sign(py - y)
+            x += np.sign(px - x)
+    
+    grid[start.y, start.x] = 2
+    grid[end.y, end.x] = 3
+
+def replay(search):
+    '''
+    Colors the next tile expanded by the fast mode search and the tiles it opened
+    
+    Walls are never colored over, in case the grid has been edited since the search was run
+    
+    Parameters
+    ----------
+    search: SearchState
+        State of the finished fast mode search
+    
+    Returns
+    -------
+    boolean
+        The result of the search once the last expanded tile has been colored, otherwise None
+    '''
+    grid, i = search.grid, search.replayLen
+    y, x = search.closedList[i]
+    opened = search.openOrder[search.openCounts[i]:search.openCounts[i + 1]]
+    opened = opened[grid[opened[:, 0], opened[:, 1]] != 1]
+    
+    if grid[y, x] != 1:
+        grid[y, x] = 5
+    grid[opened[:, 0], opened[:, 1]] = 4
+    search.replayLen = i + 1
+    if search.replayLen == search.closedLen:
+        return STEP_RESULTS[search.result]
+
+##############################
+#         Algorithms         #
+##############################
+
+# Algorithm Explanation:
+# 
+# The open list will initially contain just the Start Node
+# 
+# If the open list is empty, return False
+# - path from Start Node to End Node does not exist
+# 
+# Get next Node from open list
+# - DFS: LIFO
+# - BFS: FIFO
+# - Greedy BFS: lowest h-cost
+# - A*: lowest f-cost
+# - JPS: lowest f-cost
+# 
+# If that Node is the End Node, return True
+# - a path has been found and can be reconstructed
+# 
+# Otherwise, add that Node's available and unvisited neighbors to the open list
+# - Greedy BFS: calculate each neighbor's h-cost
+# - A*: calculate each neighbor's g-cost and h-cost
+#       If the neighbor is already in the open list, compare g-costs to check if this path to that neighbor is better
+#       If the new neighbor has a lower g-cost, push it again and skip the outdated entry when it is popped
+# - JPS: same as A*, but instead of the neighbors, open the jump points found by jumping in each direction a path could continue in
+#        Only tiles next to a wall can force a path to turn, so the tiles in between are never opened
+# 
+# Repeat
+
+def DFS(search):
+    ''' Searches as far as possible along each path before backtracking '''
+    return step(search, dfsStep)
+
+def BFS(search):
+    ''' Searches by shortest distance from the Start Node '''
+    return step(search, bfsStep)
+
+def Greedy(search):
+    ''' Searches by lowest h-cost '''
+    return step(search, greedyStep)
+
+def AStar(search):
+    ''' Searches by lowest f-cost '''
+    return step(search, aStarStep)
+
+def JPS(search):
+    ''' Searches by lowest f-cost, only opening the jump points where a path can turn (A* without diagonal movement) '''
+    return step(search, jpsStep)
+
+ALGORITHMS = (DFS, BFS, Greedy, AStar, JPS) # the index of each algorithm is passed to searchAll
+
+def step(search, kernel):
+    '''
+    Expands one tile with the input search kernel
+    
+    Parameters
+    ----------
+    search: SearchState
+        State of the current search
+    kernel: function
+        Step kernel of the current algorithm
+    
+    Returns
+    -------
+    boolean
+        True if the End Node was found, False if no path exists, otherwise None
+    '''
+    s = search
+    result, s.openHead, s.openLen, s.closedLen = kernel(s.grid, s.openList, s.openHead, s.openLen, s.pushCount, s.closedList, s.closedLen, s.openOrder, s.openCounts, s.gCosts, s.hCosts, s.tileStates, s.parentY, s.parentX, s.end.y, s.end.x, s.diagonal)
+    return STEP_RESULTS[result]
+
+##############################
+#       Search Kernels       #
+##############################
+
+# The kernels below only use integers and numpy arrays so they can be compiled by numba
+# Each step kernel expands one tile and returns a step result (SEARCHING, FOUND, or NO_PATH) with the new open and closed list bounds
+# All step kernels share the same parameters so they can be used interchangeably
+
+@njit(cache = True, boundscheck = False)
+def dfsStep(grid, openList, openHead, openLen, pushCount, closedList, closedLen, openOrder, openCounts, gCosts, hCosts, tileStates, parentY, parentX, endY, endX, diagonal):
+    ''' Expands the most recently opened tile '''
+    if openLen == 0:
+        return NO_PATH, openHead, openLen, closedLen
+    
+    openLen -= 1
+    y, x = openList[openLen, 3], openList[openLen, 4]
+    closedList[closedLen, 0], closedList[closedLen, 1] = y, x
+    closedLen += 1
+    openCounts[closedLen] = openCounts[closedLen - 1]
+    tileStates[y, x] = CLOSED
+    grid[y, x] = 5
+    
+    if y == endY and x == endX:
+        return FOUND, openHead, openLen, closedLen
+    
+    for i in range(8 if diagonal else 4):
+        ny, nx = y + OFFSETS[i, 0], x + OFFSETS[i, 1]
+        if grid[ny, nx] != 1 and tileStates[ny, nx] == UNVISITED:
+            openList[openLen, 3], openList[openLen, 4] = ny, nx
+            openLen += 1
+            tileStates[ny, nx] = OPEN
+            openOrder[openCounts[closedLen], 0], openOrder[openCounts[closedLen], 1] = ny, nx
+            openCounts[closedLen] += 1
+            parentY[ny, nx], parentX[ny, nx] = y, x
+            grid[ny, nx] = 4
+    
+    return SEARCHING, openHead, openLen, closedLen
+
+@njit(cache = True, boundscheck = False)
+def bfsStep(grid, openList, openHead, openLen, pushCount, closedList, closedLen, openOrder, openCounts, gCosts, hCosts, tileStates, parentY, parentX, endY, endX, diagonal):
+    ''' Expands the least recently opened tile '''
+    if openHead == openLen:
+        return NO_PATH, openHead, openLen, closedLen
+    
+    y, x = openList[openHead, 3], openList[openHead, 4]
+    openHead += 1
+    closedList[closedLen, 0], closedList[closedLen, 1] = y, x
+    closedLen += 1
+    openCounts[closedLen] = openCounts[closedLen - 1]
+    tileStates[y, x] = CLOSED
+    grid[y, x] = 5
+    
+    if y == endY and x == endX:
+        return FOUND, openHead, openLen, closedLen
+    
+    for i in range(8 if diagonal else 4):
+        ny, nx = y + OFFSETS[i, 0], x + OFFSETS[i, 1]
+        if grid[ny, nx] != 1 and tileStates[ny, nx] == UNVISITED:
+            openList[openLen, 3], openList[openLen, 4] = ny, nx
+            openLen += 1
+            tileStates[ny, nx] = OPEN
+            openOrder[openCounts[closedLen], 0], openOrder[openCounts[closedLen], 1] = ny, nx
+            openCounts[closedLen] += 1
+            parentY[ny, nx], parentX[ny, nx] = y, x
+            grid[ny, nx] = 4
+    
+    return SEARCHING, openHead, openLen, closedLen
+
+@njit(cache = True, boundscheck = False)
+def greedyStep(grid, openList, openHead, openLen, pushCount, closedList, closedLen, openOrder, openCounts, gCosts, hCosts, tileStates, parentY, parentX, endY, endX, diagonal):
+    ''' Expands the open tile with the lowest h-cost '''
+    if openLen == 0:
+        return NO_PATH, openHead, openLen, closedLen
+    
+    y, x, openLen = heapPop(openList, openLen)
+    closedList[closedLen, 0], closedList[closedLen, 1] = y, x
+    closedLen += 1
+    openCounts[closedLen] = openCounts[closedLen - 1]
+    tileStates[y, x] = CLOSED
+    grid[y, x] = 5
+    
+    if y == endY and x == endX:
+        return FOUND, openHead, openLen, closedLen
+    
+    for i in range(8 if diagonal else 4):
+        ny, nx = y + OFFSETS[i, 0], x + OFFSETS[i, 1]
+        if grid[ny, nx] != 1 and tileStates[ny, nx] == UNVISITED:
+            h = HCost(hCosts, ny, nx, endY, endX, diagonal)
+            openLen = heapPush(openList, openLen, pushCount, h, 0, ny, nx)
+            tileStates[ny, nx] = OPEN
+            openOrder[openCounts[closedLen], 0], openOrder[openCounts[closedLen], 1] = ny, nx
+            openCounts[closedLen] += 1
+            parentY[ny, nx], parentX[ny, nx] = y, x
+            grid[ny, nx] = 4
+    
+    return SEARCHING, openHead, openLen, closedLen
+
+@njit(cache = True, boundscheck = False)
+def aStarStep(grid, openList, openHead, openLen, pushCount, closedList, closedLen, openOrder, openCounts, gCosts, hCosts, tileStates, parentY, parentX, endY, endX, diagonal):
+    ''' Expands the open tile with the lowest f-cost '''
+    y, x, openLen, closedLen = closeLowestTile(grid, openList, openLen, closedList, closedLen, openCounts, tileStates)
+    if y < 0:
+        return NO_PATH, openHead, openLen, closedLen
+    
+    if y == endY and x == endX:
+        return FOUND, openHead, openLen, closedLen
+    
+    g = gCosts[y, x] + 1
+    for i in range(8 if diagonal else 4):
+        ny, nx = y + OFFSETS[i, 0], x + OFFSETS[i, 1]
+        state = tileStates[ny, nx]
+        if grid[ny, nx] != 1 and state != CLOSED:
+            if state == OPEN and g >= gCosts[ny, nx]:
+                continue
+            gCosts[ny, nx] = g
+            parentY[ny, nx], parentX[ny, nx] = y, x
+            h = HCost(hCosts, ny, nx, endY, endX, diagonal)
+            openLen = heapPush(openList, openLen, pushCount, g + h, h, ny, nx)
+            if state == UNVISITED:
+                tileStates[ny, nx] = OPEN
+                openOrder[openCounts[closedLen], 0], openOrder[openCounts[closedLen], 1] = ny, nx
+                openCounts[closedLen] += 1
+                grid[ny, nx] = 4
+    
+    return SEARCHING, openHead, openLen, closedLen
+
+@njit(cache = True, boundscheck = False)
+def jpsStep(grid, openList, openHead, openLen, pushCount, closedList, closedLen, openOrder, openCounts, gCosts, hCosts, tileStates, parentY, parentX, endY, endX, diagonal):
+    '''
+    Expands the open jump point with the lowest f-cost
+    
+    Jump Point Search relies on diagonal movement, so A* is used instead when it is not allowed
+    Jump points are only searched for in the directions kept by jumpDirections
+    '''
+    if not diagonal:
+        return aStarStep(grid, openList, openHead, openLen, pushCount, closedList, closedLen, openOrder, openCounts, gCosts, hCosts, tileStates, parentY, parentX, endY, endX, diagonal)
+    
+    y, x, openLen, closedLen = closeLowestTile(grid, openList, openLen, closedList, closedLen, openCounts, tileStates)
+    if y < 0:
+        return NO_PATH, openHead, openLen, closedLen
+    
+    if y == endY and x == endX:
+        return FOUND, openHead, openLen, closedLen
+    
+    directions = np.empty((8, 2), dtype = np.int32)
+    for i in range(jumpDirections(grid, y, x, parentY[y, x], parentX[y, x], directions)):
+        openLen = openJumpPoint(grid, openList, openLen, pushCount, closedLen, openOrder, openCounts, gCosts, hCosts, tileStates, parentY, parentX, y, x, directions[i, 0], directions[i, 1], endY, endX)
+    
+    return SEARCHING, openHead, openLen, closedLen
+
+@njit(cache = True, boundscheck = False)
+def closeLowestTile(grid, openList, openLen, closedList, closedLen, openCounts, tileStates):
+    '''
+    Pops the open tile with the lowest f-cost and adds it to the closed list, used by A* and JPS
+    
+    Returns the coordinates of the tile, or (-1, -1) if the open list is empty, with the new open and closed list lengths
+    '''
+    # outdated heap entries are skipped instead of being removed when a better path is found
+    while True:
+        if openLen == 0:
+            return -1, -1, openLen, closedLen
+        y, x, openLen = heapPop(openList, openLen)
+        if tileStates[y, x] != CLOSED:
+            break
+    
+    closedList[closedLen, 0], closedList[closedLen, 1] = y, x
+    closedLen += 1
+    openCounts[closedLen] = openCounts[closedLen - 1]
+    tileStates[y, x] = CLOSED
+    grid[y, x] = 5
+    return y, x, openLen, closedLen
+
+@njit(cache = True, boundscheck = False)
+def jumpDirections(grid, y, x, py, px, directions):
+    '''
+    Fills directions with the (dy, dx) rows a path can continue in from the tile at (x, y) and returns how many there are
+    
+    The Start Node (py < 0) can continue in all 8 directions
+    Otherwise only the natural directions from the parent at (px, py) and the directions forced by walls are kept
+        straight: continue straight, or turn diagonally around a wall beside this tile
+        diagonal: continue diagonally, continue along either straight part, or turn around a wall behind this tile
+    '''
+    if py < 0:
+        directions[:] = OFFSETS
+        return 8
+    
+    dy = np.sign(y - py)
+    dx = np.sign(x - px)
+    n = 0
+    if dy != 0 and dx != 0:
+        n = addDirection(directions, n, dy, 0)
+        n = addDirection(directions, n, 0, dx)
+        n = addDirection(directions, n, dy, dx)
+        if grid[y, x - dx] == 1:
+            n = addDirection(directions, n, dy, -dx)
+        if grid[y - dy, x] == 1:
+            n = addDirection(directions, n, -dy, dx)
+    elif dy != 0:
+        n = addDirection(directions, n, dy, 0)
+        if grid[y, x + 1] == 1:
+            n = addDirection(directions, n, dy, 1)
+        if grid[y, x - 1] == 1:
+            n = addDirection(directions, n, dy, -1)
+    else:
+        n = addDirection(directions, n, 0, dx)
+        if grid[y + 1, x] == 1:
+            n = addDirection(directions, n, 1, dx)
+        if grid[y - 1, x] == 1:
+            n = addDirection(directions, n, -1, dx)
+    return n
+
+@njit(cache = True, boundscheck = False)
+def addDirection(directions, n, dy, dx):
+    ''' Sets row n of directions to (dy, dx) and returns the new number of directions '''
+    directions[n, 0], directions[n, 1] = dy, dx
+    return n + 1
+
+@njit(cache = True, boundscheck = False)
+def openJumpPoint(grid, openList, openLen, pushCount, closedLen, openOrder, openCounts, gCosts, hCosts, tileStates, parentY, parentX, y, x, dy, dx, endY, endX):
+    ''' Jumps from the tile at (x, y) in the direction (dx, dy) and opens the jump point it finds like an A* neighbor, returns the new open list length '''
+    jy, jx = jump(grid, y, x, dy, dx, endY, endX)
+    if jy < 0:
+        return openLen
+    
+    state = tileStates[jy, jx]
+    g = gCosts[y, x] + max(abs(jy - y), abs(jx - x))
+    if state == CLOSED or (state == OPEN and g >= gCosts[jy, jx]):
+        return openLen
+    
+    gCosts[jy, jx] = g
+    parentY[jy, jx], parentX[jy, jx] = y, x
+    h = HCost(hCosts, jy, jx, endY, endX, True)
+    openLen = heapPush(openList, openLen, pushCount, g + h, h, jy, jx)
+    if state == UNVISITED:
+        tileStates[jy, jx] = OPEN
+        openOrder[openCounts[closedLen], 0], openOrder[openCounts[closedLen], 1] = jy, jx
+        openCounts[closedLen] += 1
+        grid[jy, jx] = 4
+    return openLen
+
+@njit(cache = True, boundscheck = False)
+def jump(grid, y, x, dy, dx, endY, endX):
+    '''
+    Moves from the tile at (x, y) in the direction (dx, dy) until a jump point or a wall is reached
+    
+    A jump point is the End Node or a tile with a forced neighbor, which is a tile that can only be reached optimally through it because of a wall
+    Moving diagonally also stops at tiles where a straight jump along either part of the direction finds a jump point
+    
+    Returns
+    -------
+    tuple
+        The coordinates of the jump point, or (-1, -1) if a wall was reached first
+    '''
+    while True:
+        y += dy
+        x += dx
+        if grid[y, x] == 1:
+            return -1, -1
+        if y == endY and x == endX:
+            return y, x
+        
+        if dy != 0 and dx != 0:
+            if (grid[y, x - dx] == 1 and grid[y + dy, x - dx] != 1) or (grid[y - dy, x] == 1 and grid[y - dy, x + dx] != 1):
+                return y, x
+            if jumpStraight(grid, y, x, dy, 0, endY, endX) or jumpStraight(grid, y, x, 0, dx, endY, endX):
+                return y, x
+        elif hasForcedNeighbor(grid, y, x, dy, dx):
+            return y, x
+
+@njit(cache = True, boundscheck = False)
+def jumpStraight(grid, y, x, dy, dx, endY, endX):
+    ''' Returns True if moving straight from the tile at (x, y) in the direction (dx, dy) reaches a jump point before a wall '''
+    while True:
+        y += dy
+        x += dx
+        if grid[y, x] == 1:
+            return False
+        if (y == endY and x == endX) or hasForcedNeighbor(grid, y, x, dy, dx):
+            return True
+
+@njit(cache = True, boundscheck = False)
+def hasForcedNeighbor(grid, y, x, dy, dx):
+    ''' Returns True if the tile at (x, y) has a forced neighbor when it is entered straight in the direction (dx, dy) '''
+    if dy != 0:
+        return (grid[y, x + 1] == 1 and grid[y + dy, x + 1] != 1) or (grid[y, x - 1] == 1 and grid[y + dy, x - 1] != 1)
+    return (grid[y + 1, x] == 1 and grid[y + 1, x + dx] != 1) or (grid[y - 1, x] == 1 and grid[y - 1, x + dx] != 1)
+
+@njit(cache = True, boundscheck = False)
+def searchAll(algorithm, grid, openList, pushCount, closedList, openOrder, openCounts, gCosts, hCosts, tileStates, parentY, parentX, endY, endX, diagonal):
+    '''
+    Runs the step kernel of the algorithm at the input index of ALGORITHMS until the search is finished
+    
+    Returns the final step result and the closed list length, which is the number of expanded tiles
+    '''
+    openHead, openLen, closedLen = 0, 1, 0
+    result = SEARCHING
+    while result == SEARCHING:
+        if algorithm == 0:
+            result, openHead, openLen, closedLen = dfsStep(grid, openList, openHead, openLen, pushCount, closedList, closedLen, openOrder, openCounts, gCosts, hCosts, tileStates, parentY, parentX, endY, endX, diagonal)
+        elif algorithm == 1:
+            result, openHead, openLen, closedLen = bfsStep(grid, openList, openHead, openLen, pushCount, closedList, closedLen, openOrder, openCounts, gCosts, hCosts, tileStates, parentY, parentX, endY, endX, diagonal)
+        elif algorithm == 2:
+            result, openHead, openLen, closedLen = greedyStep(grid, openList, openHead, openLen, pushCount, closedList, closedLen, openOrder, openCounts, gCosts, hCosts, tileStates, parentY, parentX, endY, endX, diagonal)
+        elif algorithm == 3:
+            result, openHead, openLen, closedLen = aStarStep(grid, openList, openHead, openLen, pushCount, closedList, closedLen, openOrder, openCounts, gCosts, hCosts, tileStates, parentY, parentX, endY, endX, diagonal)
+        else:
+            result, openHead, openLen, closedLen = jpsStep(grid, openList, openHead, openLen, pushCount, closedList, closedLen, openOrder, openCounts, gCosts, hCosts, tileStates, parentY, parentX, endY, endX, diagonal)
+    return result, closedLen
+
+@njit(cache = True, boundscheck = False)
+def HCost(hCosts, y, x, endY, endX, diagonal):
+    '''
+    Returns the h-cost of the tile at coordinates (x, y)
+    
+    The h-cost of a tile is the estimated path length from that tile to the End Node
+    If diagonal movement is allowed, the h-cost is the Diagonal Distance between the two Nodes
+        max(dy, dx)
+    Otherwise, the h-cost is the Manhattan Distance between the two Nodes
+        dy + dx
+    Each h-cost is only calculated once per search and is cached in hCosts
+    
+    Parameters
+    ----------
+    hCosts: ndarray
+        h-cost cache, -1 for tiles that have not been evaluated yet
+    y: int
+        y-coordinate
+    x: int
+        x-coordinate
+    endY: int
+        y-coordinate of the End Node
+    endX: int
+        x-coordinate of the End Node
+    diagonal: boolean
+        True if diagonal movement is allowed
+    
+    Returns
+    -------
+    int
+        h-cost
+    '''
+    h = hCosts[y, x]
+    if h >= 0:
+        return h
+    
+    dy = abs(endY - y)
+    dx = abs(endX - x)
+    if diagonal:
+        h = max(dy, dx)
+    else:
+        h = dy + dx
+    hCosts[y, x] = h
+    return h
+
+@njit(cache = True, boundscheck = False)
+def heapLess(heap, i, j):
+    ''' Returns True if row i of the heap array sorts before row j '''
+    for k in range(3): # the push order is unique, so the coordinates are never compared
+        if heap[i, k] != heap[j, k]:
+            return heap[i, k] < heap[j, k]
+    return False
+
+@njit(cache = True, boundscheck = False)
+def heapSwap(heap, i, j):
+    ''' Swaps rows i and j of the heap array '''
+    for k in range(5):
+        heap[i, k], heap[j, k] = heap[j, k], heap[i, k]
+
+@njit(cache = True, boundscheck = False)
+def heapPush(heap, size, pushCount, priority, h, y, x):
+    '''
+    Pushes a (priority, h-cost, push order, y, x) row onto the heap array and returns the new heap size
+    
+    The push order is taken from pushCount, so rows with the same priority and h-cost are popped in the order they were pushed
+    '''
+    i = size
+    heap[i, 0], heap[i, 1], heap[i, 2], heap[i, 3], heap[i, 4] = priority, h, pushCount[0], y, x
+    pushCount[0] += 1
+    while i > 0:
+        parent = (i - 1) // 2
+        if not heapLess(heap, i, parent):
+            break
+        heapSwap(heap, i, parent)
+        i = parent
+    return size + 1
+
+@njit(cache = True, boundscheck = False)
+def heapPop(heap, size):
+    ''' Removes the smallest row from the heap array and returns its coordinates with the new heap size '''
+    y, x = heap[0, 3], heap[0, 4]
+    size -= 1
+    heapSwap(heap, 0, size)
+    
+    i = 0
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and heapLess(heap, child + 1, child):
+            child += 1
+        if not heapLess(heap, child, i):
+            break
+        heapSwap(heap, i, child)
+        i = child
+    return y, x, size
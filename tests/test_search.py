@@ -0,0 +1,98 @@
+'''
+
+test_search.py
+
+Search Tests:
+    Runs the algorithms in search.py on random walled grids without the user interface
+    BFS, A*, and JPS must find shortest paths, and every algorithm must agree on whether a path exists
+    Fast mode must leave the grid exactly as stepping through the search does
+
+'''
+
+import os
+import sys
+import random
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from search import Node, DFS, BFS, Greedy, AStar, JPS, ALGORITHMS, newSearch, finishSearch, replay, reconstructPath
+
+GRIDS = 200
+GRID_SIZE = 16
+WALL_DENSITY = 0.3
+
+def randomGrids():
+    '''
+    Yields random grids with a wall border, along with a Start Node and an End Node on distinct path tiles
+
+    The same grids are generated on every run
+    '''
+    rng = random.Random(0)
+    for _ in range(GRIDS):
+        grid = np.ones((GRID_SIZE, GRID_SIZE), dtype = np.uint8)
+        for y in range(1, GRID_SIZE - 1):
+            for x in range(1, GRID_SIZE - 1):
+                grid[y, x] = rng.random() < WALL_DENSITY
+
+        free = list(zip(*np.nonzero(grid == 0)))
+        if len(free) < 2:
+            continue
+        (sy, sx), (ey, ex) = rng.sample(free, 2)
+        grid[sy, sx] = 2
+        grid[ey, ex] = 3
+        yield grid, Node(sy, sx, None), Node(ey, ex, None)
+
+def runSearch(grid, start, end, diagonal, algorithm, fast):
+    '''
+    Runs the input algorithm on a copy of the grid the way the main loop does
+
+    Returns
+    -------
+    tuple
+        The result of the search and the grid once the search and the path have been drawn
+    '''
+    search = newSearch(grid.copy(), start, end, diagonal)
+    if fast:
+        finishSearch(search, algorithm)
+
+    found = None
+    while found is None:
+        found = replay(search) if fast else algorithm(search)
+    if found:
+        reconstructPath(search)
+    return found, search.grid
+
+def pathLength(grid):
+    ''' Returns the number of moves in the path drawn on the grid '''
+    return np.count_nonzero(grid == 6) + 1
+
+def testShortestPaths():
+    for grid, start, end in randomGrids():
+        for diagonal in (True, False):
+            lengths = set()
+            for algorithm in (BFS, AStar, JPS):
+                found, searched = runSearch(grid, start, end, diagonal, algorithm, False)
+                lengths.add(pathLength(searched) if found else None)
+            assert len(lengths) == 1
+
+def testPathExists():
+    for grid, start, end in randomGrids():
+        for diagonal in (True, False):
+            results = {runSearch(grid, start, end, diagonal, algorithm, False)[0] for algorithm in (DFS, BFS, Greedy, AStar, JPS)}
+            assert len(results) == 1
+
+def testFastMode():
+    for grid, start, end in randomGrids():
+        for diagonal in (True, False):
+            for algorithm in ALGORITHMS:
+                stepped = runSearch(grid, start, end, diagonal, algorithm, False)
+                replayed = runSearch(grid, start, end, diagonal, algorithm, True)
+                assert stepped[0] == replayed[0]
+                assert np.array_equal(stepped[1], replayed[1])
+
+def testUnwalledGrid():
+    grid = np.zeros((5, 5), dtype = np.uint8)
+    with pytest.raises(ValueError):
+        newSearch(grid, Node(0, 0, None), Node(4, 4, None), True)